@@ -1,8 +1,9 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Type
+from typing import Dict, Generator, List, Optional, Type
 import inspect
 
 import instructor
+from instructor.dsl.partial import PartialBase
 from rich.json import JSON
 
 from atomic_agents.lib.components.agent_memory import AgentMemory
@@ -27,7 +28,8 @@ class BaseIOSchema(BaseModel):
         description = cls.__doc__
 
         if not description or not description.strip():
-            if cls.__module__ != "instructor.function_calls":
+            # Skip the models instructor generates from a schema, e.g. Partial[...] when streaming
+            if cls.__module__ != "instructor.function_calls" and not issubclass(cls, PartialBase):
                 raise ValueError(f"{cls.__name__} must have a non-empty docstring to serve as its description")
 
     @classmethod
@@ -117,6 +119,20 @@ class BaseAgent:
         """
         self.memory = self.initial_memory.copy()
 
+    def _prepare_messages(self) -> List[Dict]:
+        """
+        Builds the messages sent to the language model: the system prompt followed by the chat history.
+
+        Returns:
+            List[Dict]: The messages for the chat completion request.
+        """
+        return [
+            {
+                "role": "system",
+                "content": self.system_prompt_generator.generate_prompt(),
+            }
+        ] + self.memory.get_history()
+
     def get_response(self, response_model=None) -> Type[BaseModel]:
         """
         Obtains a response from the language model.
@@ -131,35 +147,125 @@ class BaseAgent:
         if response_model is None:
             response_model = self.output_schema
 
-        messages = [
-            {
-                "role": "system",
-                "content": self.system_prompt_generator.generate_prompt(),
-            }
-        ] + self.memory.get_history()
+        messages = self._prepare_messages()
         response = self.client.chat.completions.create(model=self.model, messages=messages, response_model=response_model)
         return response
 
-    def run(self, user_input: Optional[Type[BaseIOSchema]] = None) -> Type[BaseIOSchema]:
+    async def get_response_async(self, response_model=None) -> Type[BaseModel]:
         """
-        Runs the chat agent with the given user input.
+        Obtains a response from the language model asynchronously. Requires an asynchronous client,
+        e.g. `instructor.from_openai(openai.AsyncOpenAI())`.
 
         Args:
-            user_input (Optional[Type[BaseIOSchema]]): The input from the user. If not provided, skips adding to memory.
+            response_model (Type[BaseModel], optional):
+                The schema for the response data. If not set, self.output_schema is used.
 
         Returns:
-            Type[BaseIOSchema]: The response from the chat agent.
+            Type[BaseModel]: The response from the language model.
+        """
+        if response_model is None:
+            response_model = self.output_schema
+
+        messages = self._prepare_messages()
+        response = await self.client.chat.completions.create(
+            model=self.model, messages=messages, response_model=response_model
+        )
+        return response
+
+    def get_response_stream(self, response_model=None) -> Generator[Type[BaseModel], None, None]:
+        """
+        Obtains a response from the language model as a stream of partial responses.
+
+        Args:
+            response_model (Type[BaseModel], optional):
+                The schema for the response data. If not set, self.output_schema is used.
+
+        Yields:
+            Type[BaseModel]: The response so far, with fields that have not been generated yet set to None.
+        """
+        if response_model is None:
+            response_model = self.output_schema
+
+        messages = self._prepare_messages()
+        yield from self.client.chat.completions.create_partial(
+            model=self.model, messages=messages, response_model=response_model
+        )
+
+    def _add_user_input(self, user_input: Optional[Type[BaseIOSchema]]):
+        """
+        Starts a new turn and adds the user input to memory, if provided.
+
+        Args:
+            user_input (Optional[Type[BaseIOSchema]]): The input from the user.
         """
         if user_input:
             self.memory.initialize_turn()
             self.current_user_input = user_input
             self.memory.add_message("user", str(user_input))
 
+    def run(self, user_input: Optional[Type[BaseIOSchema]] = None) -> Type[BaseIOSchema]:
+        """
+        Runs the chat agent with the given user input.
+
+        Args:
+            user_input (Optional[Type[BaseIOSchema]]): The input from the user. If not provided, skips adding to memory.
+
+        Returns:
+            Type[BaseIOSchema]: The response from the chat agent.
+        """
+        self._add_user_input(user_input)
+
         response = self.get_response(response_model=self.output_schema)
         self.memory.add_message("assistant", str(response))
 
         return response
 
+    def run_stream(self, user_input: Optional[Type[BaseIOSchema]] = None) -> Generator[Type[BaseIOSchema], None, None]:
+        """
+        Runs the chat agent with the given user input, streaming the response as it is generated.
+
+        The complete response is added to memory once the stream is exhausted. If the caller stops iterating early,
+        the last received response is added instead. Nothing is added if no response was received or if the stream
+        raises an error.
+
+        Args:
+            user_input (Optional[Type[BaseIOSchema]]): The input from the user. If not provided, skips adding to memory.
+
+        Yields:
+            Type[BaseIOSchema]: The response so far, with fields that have not been generated yet set to None.
+        """
+        self._add_user_input(user_input)
+
+        response = None
+        try:
+            for response in self.get_response_stream(response_model=self.output_schema):
+                yield response
+        except GeneratorExit:
+            # The caller stopped iterating early, so the last received response is stored
+            if response is not None:
+                self.memory.add_message("assistant", str(response))
+            raise
+
+        if response is not None:
+            self.memory.add_message("assistant", str(response))
+
+    async def run_async(self, user_input: Optional[Type[BaseIOSchema]] = None) -> Type[BaseIOSchema]:
+        """
+        Runs the chat agent with the given user input asynchronously. Requires an asynchronous client.
+
+        Args:
+            user_input (Optional[Type[BaseIOSchema]]): The input from the user. If not provided, skips adding to memory.
+
+        Returns:
+            Type[BaseIOSchema]: The response from the chat agent.
+        """
+        self._add_user_input(user_input)
+
+        response = await self.get_response_async(response_model=self.output_schema)
+        self.memory.add_message("assistant", str(response))
+
+        return response
+
     def get_context_provider(self, provider_name: str) -> Type[SystemPromptContextProviderBase]:
         """
         Retrieves a context provider by name.
@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from pydantic import Field, create_model
@@ -73,6 +74,47 @@ class ToolInterfaceAgent(BaseAgent):
             output_instructions=output_instructions,
         )
 
+    def _add_tool_call_message(self, tool_input):
+        """
+        Adds the tool call to memory.
+
+        Args:
+            tool_input: The tool input obtained from the language model.
+        """
+        formatted_tool_input = format_tool_message(tool_input)
+        self.memory.add_message("assistant", "TOOL CALL: " + json.dumps(formatted_tool_input))
+
+    def _add_tool_output_messages(self, tool_output):
+        """
+        Adds the tool output to memory, followed by the instruction to respond based on it.
+
+        Args:
+            tool_output: The output of the tool.
+        """
+        self.memory.add_message("assistant", "TOOL RESPONSE: " + tool_output.model_dump_json())
+        self.memory.add_message(
+            "assistant",
+            "I will now formulate a response for the user based on the tool output.",
+        )
+
+    def _call_tool(self):
+        """
+        Gets the tool input from the language model, runs the tool, and adds the tool call and output to memory.
+        """
+        tool_input = super().get_response(response_model=self.tool_instance.input_schema)
+        self._add_tool_call_message(tool_input)
+        tool_output = self.tool_instance.run(tool_input)
+        self._add_tool_output_messages(tool_output)
+
+    async def _call_tool_async(self):
+        """
+        Asynchronous version of `_call_tool`. The tool itself is run in a worker thread, as tools are synchronous.
+        """
+        tool_input = await super().get_response_async(response_model=self.tool_instance.input_schema)
+        self._add_tool_call_message(tool_input)
+        tool_output = await asyncio.to_thread(self.tool_instance.run, tool_input)
+        self._add_tool_output_messages(tool_output)
+
     def get_response(self, response_model=None):
         """
         Handles obtaining and processing the response from the tool.
@@ -86,20 +128,37 @@ class ToolInterfaceAgent(BaseAgent):
         Returns:
             BaseModel: The processed response.
         """
-        tool_input = super().get_response(response_model=self.tool_instance.input_schema)
-        formatted_tool_input = format_tool_message(tool_input)
+        self._call_tool()
+        response = super().get_response(response_model=response_model or self.output_schema)
+        return response
 
-        self.memory.add_message("assistant", "TOOL CALL: " + json.dumps(formatted_tool_input))
-        tool_output = self.tool_instance.run(tool_input)
-        self.memory.add_message("assistant", "TOOL RESPONSE: " + tool_output.model_dump_json())
+    async def get_response_async(self, response_model=None):
+        """
+        Asynchronous version of `get_response`. Requires an asynchronous client.
 
-        self.memory.add_message(
-            "assistant",
-            "I will now formulate a response for the user based on the tool output.",
-        )
-        response = super().get_response(response_model=response_model or self.output_schema)
+        Args:
+            response_model: The schema for the response data. If not set, self.output_schema is used.
+
+        Returns:
+            BaseModel: The processed response.
+        """
+        await self._call_tool_async()
+        response = await super().get_response_async(response_model=response_model or self.output_schema)
         return response
 
+    def get_response_stream(self, response_model=None):
+        """
+        Runs the tool like `get_response`, then streams the response formulated from the tool output.
+
+        Args:
+            response_model: The schema for the response data. If not set, self.output_schema is used.
+
+        Yields:
+            BaseModel: The response so far, with fields that have not been generated yet set to None.
+        """
+        self._call_tool()
+        yield from super().get_response_stream(response_model=response_model or self.output_schema)
+
 
 if __name__ == "__main__":
     from rich.console import Console
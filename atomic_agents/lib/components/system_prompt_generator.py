@@ -22,9 +22,11 @@ class SystemPromptGenerator:
         output_instructions: Optional[List[str]] = None,
         context_providers: Optional[Dict[str, SystemPromptContextProviderBase]] = None,
     ):
-        self.background = background or ["This is a conversation with a helpful and friendly AI assistant."]
-        self.steps = steps or []
-        self.output_instructions = output_instructions or []
+        # Copy the given lists so extending them below never changes the caller's lists. Otherwise, reusing a list
+        # for several generators would duplicate instructions and make the rendered prompt differ between agents.
+        self.background = list(background or ["This is a conversation with a helpful and friendly AI assistant."])
+        self.steps = list(steps or [])
+        self.output_instructions = list(output_instructions or [])
         self.context_providers = context_providers or {}
 
         self.output_instructions.extend(
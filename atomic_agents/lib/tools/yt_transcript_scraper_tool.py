@@ -1,14 +1,33 @@
+import asyncio
+import json
+import logging
 import os
-from typing import List, Optional
-
-from googleapiclient.discovery import build
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from cachetools import LRUCache, TTLCache
 from pydantic import Field
+from requests.adapters import HTTPAdapter
 from rich.console import Console
-from youtube_transcript_api import NoTranscriptFound, TranscriptsDisabled, YouTubeTranscriptApi
 
 from atomic_agents.agents.base_agent import BaseIOSchema
 from atomic_agents.lib.tools.base_tool import BaseTool, BaseToolConfig
 
+logger = logging.getLogger(__name__)
+
+YOUTUBE_VIDEOS_URL = "https://youtube.googleapis.com/youtube/v3/videos"
+# The YouTube Data API accepts at most 50 comma-separated IDs per videos.list request
+MAX_VIDEO_IDS_PER_REQUEST = 50
+
+VIDEO_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{11}")
+VIDEO_ID_PATH_PREFIXES = ("shorts", "embed", "live", "v")
+
 
 ################
 # INPUT SCHEMA #
@@ -21,6 +40,7 @@ class YouTubeTranscriptToolInputSchema(BaseIOSchema):
 
     video_url: str = Field(..., description="URL of the YouTube video to fetch the transcript for.")
     language: Optional[str] = Field(None, description="Language code for the transcript (e.g., 'en' for English).")
+    no_cache: bool = Field(False, description="Whether to bypass the cache and always fetch fresh data.")
 
 
 ####################
@@ -43,6 +63,21 @@ class YouTubeTranscriptToolConfig(BaseToolConfig):
         description="YouTube API key for fetching video metadata.",
         default=os.getenv("YOUTUBE_API_KEY"),
     )
+    metadata_cache_ttl: float = Field(86400, description="Time in seconds for which fetched video metadata is cached.")
+    metadata_cache_maxsize: int = Field(4096, description="Maximum number of videos whose metadata is cached.")
+    transcript_cache_path: str = Field(
+        ":memory:", description="Path of the SQLite database used to cache transcripts. Defaults to an in-memory database."
+    )
+    transcript_cache_ttl: float = Field(
+        86400, description="Time in seconds for which a cached transcript is considered fresh."
+    )
+    transcript_cache_stale_ttl: float = Field(
+        604800,
+        description="Time in seconds for which a stale cached transcript is still returned while being refreshed.",
+    )
+    http_pool_connections: int = Field(8, description="Number of hosts to keep connection pools for.")
+    http_pool_maxsize: int = Field(32, description="Maximum number of connections kept alive per host.")
+    http_timeout: float = Field(10.0, description="Timeout in seconds for requests to the YouTube Data API.")
 
 
 class YouTubeTranscriptTool(BaseTool):
@@ -66,6 +101,31 @@ class YouTubeTranscriptTool(BaseTool):
         """
         super().__init__(config)
         self.api_key = config.api_key
+        # Background refreshes of stale transcripts run on their own pool, so they never delay a caller's requests
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="yt-transcript-refresh")
+        self._metadata_cache = TTLCache(maxsize=config.metadata_cache_maxsize, ttl=config.metadata_cache_ttl)
+        # ETags of previous responses, kept after the metadata expires so it can be revalidated with a conditional request
+        self._metadata_etags = LRUCache(maxsize=config.metadata_cache_maxsize)
+        self._metadata_cache_lock = threading.Lock()
+        self.transcript_cache_ttl = config.transcript_cache_ttl
+        self.transcript_cache_stale_ttl = config.transcript_cache_stale_ttl
+        self._transcript_cache = sqlite3.connect(config.transcript_cache_path, check_same_thread=False)
+        self._transcript_cache.execute("PRAGMA journal_mode=WAL")
+        self._transcript_cache.execute(
+            "CREATE TABLE IF NOT EXISTS transcripts ("
+            "video_id TEXT NOT NULL, language TEXT NOT NULL, text_json TEXT NOT NULL, fetched_at REAL NOT NULL, "
+            "PRIMARY KEY (video_id, language))"
+        )
+        self._transcript_cache_lock = threading.Lock()
+        # Transcripts with a background refresh queued or running, so repeated stale hits schedule a single refresh
+        self._pending_refreshes = set()
+        # A pooled session keeps connections to the YouTube Data API alive between requests
+        self.http_timeout = config.http_timeout
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=config.http_pool_connections, pool_maxsize=config.http_pool_maxsize)
+        self._session.mount("https://", adapter)
+        self._inflight: Dict[Tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     def run(self, params: YouTubeTranscriptToolInputSchema) -> YouTubeTranscriptToolOutputSchema:
         """
@@ -78,21 +138,84 @@ class YouTubeTranscriptTool(BaseTool):
             YouTubeTranscriptToolOutputSchema: The output of the tool, adhering to the output schema.
 
         Raises:
+            ValueError: If the video URL does not contain a valid video ID.
             Exception: If fetching the transcript fails.
         """
         video_id = self.extract_video_id(params.video_url)
-        try:
-            if params.language:
-                transcripts = YouTubeTranscriptApi.get_transcript(video_id, languages=[params.language])
-            else:
-                transcripts = YouTubeTranscriptApi.get_transcript(video_id)
-        except (NoTranscriptFound, TranscriptsDisabled) as e:
-            raise Exception(f"Failed to fetch transcript for video '{video_id}': {str(e)}")
 
-        transcript_text = " ".join([transcript["text"] for transcript in transcripts])
-        total_duration = sum([transcript["duration"] for transcript in transcripts])
+        # The transcript and the metadata are independent requests, so the metadata is fetched on a worker thread
+        # while the transcript is fetched on this one. The worker belongs to this call, so concurrent calls never
+        # wait for each other.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            metadata_future = executor.submit(self.fetch_video_metadata, video_id, not params.no_cache)
+            transcripts = self.fetch_transcript(video_id, params.language, not params.no_cache)
+            metadata = metadata_future.result()
+
+        return self._build_output(transcripts, metadata)
+
+    async def run_many(self, params_list: List[YouTubeTranscriptToolInputSchema]) -> List[YouTubeTranscriptToolOutputSchema]:
+        """
+        Runs the YouTubeTranscriptTool for multiple videos concurrently.
+
+        The transcripts are fetched concurrently, while the metadata is fetched in batched requests, one batch
+        for the inputs that use the cache and one for the inputs with `no_cache` set.
+
+        Args:
+            params_list (List[YouTubeTranscriptToolInputSchema]): The input parameters for each video.
+
+        Returns:
+            List[YouTubeTranscriptToolOutputSchema]: The outputs of the tool, in the same order as the inputs.
+
+        Raises:
+            ValueError: If a video URL does not contain a valid video ID.
+            Exception: If fetching a transcript or the metadata fails.
+        """
+        video_ids = [self.extract_video_id(params.video_url) for params in params_list]
+
+        # The upstream libraries are synchronous, so their calls are run in worker threads.
+        transcript_tasks = [
+            asyncio.to_thread(self.fetch_transcript, video_id, params.language, not params.no_cache)
+            for video_id, params in zip(video_ids, params_list)
+        ]
+        # Videos are grouped by their no_cache flag, so the flag of one input does not affect the others
+        metadata_tasks = {}
+        for use_cache in (True, False):
+            group_ids = [video_id for video_id, params in zip(video_ids, params_list) if params.no_cache != use_cache]
+            if group_ids:
+                metadata_tasks[use_cache] = asyncio.to_thread(self.fetch_video_metadata_bulk, group_ids, use_cache)
+
+        results = await asyncio.gather(*transcript_tasks, *metadata_tasks.values())
+        num_transcripts = len(transcript_tasks)
+        all_transcripts = results[:num_transcripts]
+        metadata_by_group = dict(zip(metadata_tasks, results[num_transcripts:]))
+
+        outputs = []
+        for video_id, params, transcripts in zip(video_ids, params_list, all_transcripts):
+            metadata_by_id = metadata_by_group[not params.no_cache]
+            if video_id not in metadata_by_id:
+                raise Exception(f"No metadata found for video '{video_id}'")
+            outputs.append(self._build_output(transcripts, metadata_by_id[video_id]))
+        return outputs
+
+    @staticmethod
+    def _build_output(transcripts: List[dict], metadata: dict) -> YouTubeTranscriptToolOutputSchema:
+        """
+        Builds the tool output from the transcript segments and the video metadata.
+
+        Args:
+            transcripts (List[dict]): The transcript segments.
+            metadata (dict): The metadata of the video.
 
-        metadata = self.fetch_video_metadata(video_id)
+        Returns:
+            YouTubeTranscriptToolOutputSchema: The output of the tool, adhering to the output schema.
+        """
+        # Collect the text and the total duration in a single pass, as transcripts can have thousands of segments
+        text_parts = []
+        total_duration = 0.0
+        for transcript in transcripts:
+            text_parts.append(transcript["text"])
+            total_duration += transcript["duration"]
+        transcript_text = " ".join(text_parts)
 
         return YouTubeTranscriptToolOutputSchema(
             transcript=transcript_text,
@@ -101,44 +224,324 @@ class YouTubeTranscriptTool(BaseTool):
             metadata=metadata,
         )
 
+    def fetch_transcript(self, video_id: str, language: Optional[str] = None, use_cache: bool = True) -> List[dict]:
+        """
+        Fetches the transcript segments of a YouTube video.
+
+        Cached transcripts are returned without a request while fresh. Stale transcripts are still returned,
+        but are refreshed in the background.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            language (Optional[str]): Language code for the transcript.
+            use_cache (bool): Whether to return a cached transcript if available and cache the fetched transcript.
+
+        Returns:
+            List[dict]: The transcript segments, each with text, start time, and duration.
+
+        Raises:
+            Exception: If no transcript is available for the video.
+        """
+        if use_cache:
+            cached = self._get_cached_transcript(video_id, language)
+            if cached is not None:
+                transcripts, fetched_at = cached
+                age = time.time() - fetched_at
+                if age < self.transcript_cache_ttl:
+                    return transcripts
+                if age < self.transcript_cache_stale_ttl:
+                    self._schedule_refresh(video_id, language)
+                    return transcripts
+
+        transcripts = self._singleflight(("transcript", video_id, language), self._download_transcript, video_id, language)
+        if use_cache:
+            self._store_transcript(video_id, language, transcripts)
+        return transcripts
+
+    @staticmethod
+    def _download_transcript(video_id: str, language: Optional[str] = None) -> List[dict]:
+        """
+        Downloads the transcript segments of a YouTube video from the YouTube Transcript API.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            language (Optional[str]): Language code for the transcript.
+
+        Returns:
+            List[dict]: The transcript segments, each with text, start time, and duration.
+
+        Raises:
+            Exception: If no transcript is available for the video.
+        """
+        # Imported here so that importing this module stays cheap when no transcript is ever fetched
+        from youtube_transcript_api import NoTranscriptFound, TranscriptsDisabled, YouTubeTranscriptApi
+
+        try:
+            if language:
+                return YouTubeTranscriptApi.get_transcript(video_id, languages=[language])
+            return YouTubeTranscriptApi.get_transcript(video_id)
+        except (NoTranscriptFound, TranscriptsDisabled) as e:
+            raise Exception(f"Failed to fetch transcript for video '{video_id}': {str(e)}")
+
+    def _schedule_refresh(self, video_id: str, language: Optional[str] = None):
+        """
+        Schedules a background refresh of a cached transcript, unless one is already pending.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            language (Optional[str]): Language code for the transcript.
+        """
+        key = (video_id, language)
+        with self._transcript_cache_lock:
+            if key in self._pending_refreshes:
+                return
+            self._pending_refreshes.add(key)
+        future = self._refresh_executor.submit(self._refresh_transcript, video_id, language)
+        future.add_done_callback(self._log_refresh_failure)
+
+    def _refresh_transcript(self, video_id: str, language: Optional[str] = None):
+        """
+        Downloads the transcript of a YouTube video and replaces the cached copy.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            language (Optional[str]): Language code for the transcript.
+        """
+        try:
+            transcripts = self._singleflight(("transcript", video_id, language), self._download_transcript, video_id, language)
+            self._store_transcript(video_id, language, transcripts)
+        finally:
+            with self._transcript_cache_lock:
+                self._pending_refreshes.discard((video_id, language))
+
+    @staticmethod
+    def _log_refresh_failure(future: Future):
+        """
+        Logs the exception of a failed background transcript refresh, which would otherwise go unnoticed.
+
+        Args:
+            future (Future): The future of the refresh.
+        """
+        exception = future.exception()
+        if exception is not None:
+            logger.warning("Failed to refresh cached transcript: %s", exception, exc_info=exception)
+
+    def _get_cached_transcript(self, video_id: str, language: Optional[str] = None) -> Optional[Tuple[List[dict], float]]:
+        """
+        Looks up a cached transcript.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            language (Optional[str]): Language code for the transcript.
+
+        Returns:
+            Optional[Tuple[List[dict], float]]: The transcript segments and the time they were fetched, if cached.
+        """
+        with self._transcript_cache_lock:
+            row = self._transcript_cache.execute(
+                "SELECT text_json, fetched_at FROM transcripts WHERE video_id = ? AND language = ?",
+                (video_id, language or ""),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def _store_transcript(self, video_id: str, language: Optional[str], transcripts: List[dict]):
+        """
+        Stores a transcript in the cache.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            language (Optional[str]): Language code for the transcript.
+            transcripts (List[dict]): The transcript segments.
+        """
+        with self._transcript_cache_lock, self._transcript_cache:
+            self._transcript_cache.execute(
+                "INSERT OR REPLACE INTO transcripts (video_id, language, text_json, fetched_at) VALUES (?, ?, ?, ?)",
+                (video_id, language or "", json.dumps(transcripts), time.time()),
+            )
+
     @staticmethod
     def extract_video_id(url: str) -> str:
         """
         Extracts the video ID from a YouTube URL.
 
+        Supports watch URLs, youtu.be short links, and shorts, embed, live and v paths. A bare video ID is returned as is.
+
         Args:
             url (str): The YouTube video URL.
 
         Returns:
             str: The extracted video ID.
-        """
-        return url.split("v=")[-1].split("&")[0]
 
-    def fetch_video_metadata(self, video_id: str) -> dict:
+        Raises:
+            ValueError: If no valid video ID can be extracted from the URL.
+        """
+        url = url.strip()
+        if VIDEO_ID_PATTERN.fullmatch(url):
+            return url
+
+        parsed = urlparse(url if "//" in url else f"//{url}")
+        host = parsed.netloc.lower().split(":")[0]
+        path_segments = [segment for segment in parsed.path.split("/") if segment]
+
+        video_id = None
+        if host == "youtu.be":
+            video_id = path_segments[0] if path_segments else None
+        elif len(path_segments) >= 2 and path_segments[0] in VIDEO_ID_PATH_PREFIXES:
+            video_id = path_segments[1]
+        else:
+            video_id = parse_qs(parsed.query).get("v", [None])[0]
+
+        if not video_id or not VIDEO_ID_PATTERN.fullmatch(video_id):
+            raise ValueError(f"Could not extract a YouTube video ID from '{url}'")
+        return video_id
+
+    def fetch_video_metadata(self, video_id: str, use_cache: bool = True) -> dict:
         """
         Fetches metadata for a YouTube video.
 
         Args:
             video_id (str): The YouTube video ID.
+            use_cache (bool): Whether to return cached metadata if available and cache the fetched metadata.
 
         Returns:
             dict: The metadata of the video.
-        """
-        youtube = build("youtube", "v3", developerKey=self.api_key)
-        request = youtube.videos().list(part="snippet", id=video_id)
-        response = request.execute()
 
-        if not response["items"]:
+        Raises:
+            Exception: If no metadata is found for the video.
+        """
+        metadata_by_id = self.fetch_video_metadata_bulk([video_id], use_cache)
+        if video_id not in metadata_by_id:
             raise Exception(f"No metadata found for video '{video_id}'")
+        return metadata_by_id[video_id]
+
+    def fetch_video_metadata_bulk(self, video_ids: List[str], use_cache: bool = True) -> Dict[str, dict]:
+        """
+        Fetches metadata for multiple YouTube videos, requesting up to 50 videos per API call.
 
-        video_info = response["items"][0]["snippet"]
-        metadata = {
+        When the cache is used and a request for the same videos was made before, the request is made
+        conditional on the previous response's ETag, so unchanged metadata is not downloaded again.
+
+        Args:
+            video_ids (List[str]): The YouTube video IDs.
+            use_cache (bool): Whether to return cached metadata if available and cache the fetched metadata.
+
+        Returns:
+            Dict[str, dict]: The metadata of each video, keyed by video ID. Videos without metadata are omitted.
+        """
+        video_ids = list(dict.fromkeys(video_ids))
+        metadata_by_id = {}
+        if use_cache:
+            with self._metadata_cache_lock:
+                metadata_by_id = {
+                    video_id: self._metadata_cache[video_id] for video_id in video_ids if video_id in self._metadata_cache
+                }
+
+        missing_ids = [video_id for video_id in video_ids if video_id not in metadata_by_id]
+        if not missing_ids:
+            return metadata_by_id
+
+        fetched = {}
+        for start in range(0, len(missing_ids), MAX_VIDEO_IDS_PER_REQUEST):
+            end = start + MAX_VIDEO_IDS_PER_REQUEST
+            ids = ",".join(missing_ids[start:end])
+            fetched.update(self._singleflight(("metadata", ids), self._fetch_video_metadata_chunk, ids, use_cache))
+
+        if use_cache:
+            with self._metadata_cache_lock:
+                self._metadata_cache.update(fetched)
+        metadata_by_id.update(fetched)
+        return metadata_by_id
+
+    def _fetch_video_metadata_chunk(self, ids: str, use_cache: bool = True) -> Dict[str, dict]:
+        """
+        Fetches metadata for up to 50 YouTube videos in a single request, revalidating a previous response if possible.
+
+        Args:
+            ids (str): The comma-separated YouTube video IDs.
+            use_cache (bool): Whether to revalidate a previous response and store the ETag of this one.
+
+        Returns:
+            Dict[str, dict]: The metadata of each video, keyed by video ID. Videos without metadata are omitted.
+        """
+        previous = None
+        if use_cache:
+            with self._metadata_cache_lock:
+                previous = self._metadata_etags.get(ids)
+
+        headers = {"If-None-Match": previous[0]} if previous is not None else {}
+        response = self._session.get(
+            YOUTUBE_VIDEOS_URL,
+            params={"part": "snippet", "id": ids, "key": self.api_key},
+            headers=headers,
+            timeout=self.http_timeout,
+        )
+        if response.status_code == 304 and previous is not None:
+            # Not modified, so the previously fetched metadata is still current
+            return dict(previous[1])
+        if response.status_code != 200:
+            raise Exception(f"Failed to fetch metadata for videos '{ids}': {response.status_code} {response.reason}")
+        data = response.json()
+
+        metadata_by_id = {item["id"]: self._parse_video_metadata(item["id"], item["snippet"]) for item in data["items"]}
+        if use_cache and "etag" in data:
+            with self._metadata_cache_lock:
+                self._metadata_etags[ids] = (data["etag"], metadata_by_id)
+        return metadata_by_id
+
+    def _singleflight(self, key: Tuple, fn: Callable[..., Any], *args) -> Any:
+        """
+        Calls `fn`, unless a call with the same key is already in flight, in which case its result is shared.
+
+        Args:
+            key (Tuple): Identifies the request, e.g. the kind of data and the video ID.
+            fn (Callable[..., Any]): The function performing the request.
+            *args: The arguments for `fn`.
+
+        Returns:
+            Any: The result of the call.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    @staticmethod
+    def _parse_video_metadata(video_id: str, video_info: dict) -> dict:
+        """
+        Extracts the relevant metadata fields from a video snippet.
+
+        Args:
+            video_id (str): The YouTube video ID.
+            video_info (dict): The snippet returned by the YouTube Data API.
+
+        Returns:
+            dict: The metadata of the video.
+        """
+        return {
             "id": video_id,
             "title": video_info["title"],
             "channel": video_info["channelTitle"],
             "published_at": video_info["publishedAt"],
         }
-        return metadata
 
 
 #################
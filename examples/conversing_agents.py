@@ -1,6 +1,9 @@
+import asyncio
+import hashlib
 import json
 import os
 import random
+import sqlite3
 import groq
 import instructor
 import openai
@@ -8,16 +11,24 @@ from rich.console import Console
 from atomic_agents.agents.base_agent import BaseAgentConfig, BaseAgent, BaseAgentInputSchema, BaseAgentOutputSchema
 from atomic_agents.lib.components.system_prompt_generator import SystemPromptGenerator
 
-# Initialize the system prompts. For simplicity, we use the same system prompt for both agents.
-agent1_system_prompt_generator = SystemPromptGenerator(
-    background=["You are an agent that adds 1 to the number said by the previous person in the conversation."],
-    steps=["If the previous message contains a number, add 1 to it."],
-    output_instructions=[
-        "Respond with only the resulting added number and never anything else. Do not include any additional text."
-    ],
-)
 
-agent2_system_prompt_generator = SystemPromptGenerator(
+class PrecompiledSystemPromptGenerator(SystemPromptGenerator):
+    """
+    System prompt generator that renders the prompt once and returns the same string on every call.
+
+    Only suitable without context providers, as their information can change between calls.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.prompt = super().generate_prompt()
+
+    def generate_prompt(self) -> str:
+        return self.prompt
+
+
+# Initialize the system prompt. Both agents share the same generator, so they send the exact same prompt prefix.
+system_prompt_generator = PrecompiledSystemPromptGenerator(
     background=["You are an agent that adds 1 to the number said by the previous person in the conversation."],
     steps=["If the previous message contains a number, add 1 to it."],
     output_instructions=[
@@ -31,7 +42,7 @@ agent1 = BaseAgent(
     config=BaseAgentConfig(
         client=instructor.from_openai(openai.OpenAI()),
         model="gpt-4o-mini",
-        system_prompt_generator=agent2_system_prompt_generator,
+        system_prompt_generator=system_prompt_generator,
     )
 )
 
@@ -40,27 +51,140 @@ agent2 = BaseAgent(
     config=BaseAgentConfig(
         client=instructor.from_openai(openai.OpenAI()),
         model="gpt-4o-mini",
-        system_prompt_generator=agent2_system_prompt_generator,
+        system_prompt_generator=system_prompt_generator,
     )
 )
 
 
+class ResponseCache:
+    """
+    Persistent cache of agent responses, keyed by the model, the system prompt and the normalized chat message.
+
+    The agents in this example only look at the latest message, so a previously generated response can be
+    reused without calling the language model. Matching is exact rather than by embedding similarity, because
+    messages such as "124" and "125" are nearly identical semantically but need different answers.
+    """
+
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response_json TEXT NOT NULL)")
+
+    @staticmethod
+    def make_key(agent: BaseAgent, chat_message: str) -> str:
+        normalized_message = " ".join(chat_message.split()).lower()
+        key_data = [agent.model, agent.system_prompt_generator.generate_prompt(), normalized_message]
+        return hashlib.sha256(json.dumps(key_data).encode()).hexdigest()
+
+    def get(self, key: str):
+        row = self.connection.execute("SELECT response_json FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, response_json: str):
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses (key, response_json) VALUES (?, ?)", (key, response_json)
+            )
+
+
+response_cache = ResponseCache(os.getenv("CONVERSING_AGENTS_CACHE_PATH", "conversing_agents_cache.db"))
+
+
+def _replay_cached_response(agent: BaseAgent, user_input: BaseAgentInputSchema, cached_response: str) -> BaseAgentOutputSchema:
+    """
+    Adds a cached exchange to the agent's memory, keeping it consistent with a regular run.
+    """
+    response = agent.output_schema.model_validate_json(cached_response)
+    agent.memory.initialize_turn()
+    agent.current_user_input = user_input
+    agent.memory.add_message("user", str(user_input))
+    agent.memory.add_message("assistant", str(response))
+    return response
+
+
+def cached_run(agent: BaseAgent, user_input: BaseAgentInputSchema) -> BaseAgentOutputSchema:
+    """
+    Runs the agent, reusing a cached response for a previously seen message instead of calling the language model.
+    """
+    key = response_cache.make_key(agent, user_input.chat_message)
+    cached_response = response_cache.get(key)
+    if cached_response is not None:
+        return _replay_cached_response(agent, user_input, cached_response)
+
+    response = agent.run(user_input)
+    response_cache.set(key, response.model_dump_json())
+    return response
+
+
+async def cached_run_async(agent: BaseAgent, user_input: BaseAgentInputSchema) -> BaseAgentOutputSchema:
+    """
+    Asynchronous version of `cached_run`, for agents using an asynchronous client.
+    """
+    key = response_cache.make_key(agent, user_input.chat_message)
+    cached_response = response_cache.get(key)
+    if cached_response is not None:
+        return _replay_cached_response(agent, user_input, cached_response)
+
+    response = await agent.run_async(user_input)
+    response_cache.set(key, response.model_dump_json())
+    return response
+
+
 # Function to simulate a conversation between the two agents
 def simulate_conversation(num_turns=5):
     console = Console()
     next_input = "123"
 
     for _ in range(num_turns):
-        agent1_response = agent1.run(agent1.input_schema(chat_message=next_input))
+        agent1_response = cached_run(agent1, agent1.input_schema(chat_message=next_input))
         console.print(f"[bold blue]Agent 1:[/bold blue] {agent1_response.chat_message}")
         next_input = agent1_response.chat_message
 
-        agent2_response = agent2.run(agent2.input_schema(chat_message=next_input))
+        agent2_response = cached_run(agent2, agent2.input_schema(chat_message=next_input))
         console.print(f"[bold green]Agent 2:[/bold green] {agent2_response.chat_message}")
         next_input = agent2_response.chat_message
 
     print("Done")
 
 
+def create_async_agent(system_prompt_generator: SystemPromptGenerator) -> BaseAgent:
+    """
+    Creates an agent with an asynchronous client. Each conversation gets its own agents, so their memories stay separate.
+    """
+    return BaseAgent(
+        config=BaseAgentConfig(
+            client=instructor.from_openai(openai.AsyncOpenAI(), mode=instructor.Mode.TOOLS),
+            model="gpt-4o-mini",
+            system_prompt_generator=system_prompt_generator,
+        )
+    )
+
+
+# Asynchronous version of simulate_conversation, so that many conversations can run concurrently
+async def simulate_conversation_async(seed=123, num_turns=5):
+    console = Console()
+    async_agent1 = create_async_agent(system_prompt_generator)
+    async_agent2 = create_async_agent(system_prompt_generator)
+    next_input = str(seed)
+
+    for _ in range(num_turns):
+        agent1_response = await cached_run_async(async_agent1, async_agent1.input_schema(chat_message=next_input))
+        console.print(f"[bold blue]Agent 1 ({seed}):[/bold blue] {agent1_response.chat_message}")
+        next_input = agent1_response.chat_message
+
+        agent2_response = await cached_run_async(async_agent2, async_agent2.input_schema(chat_message=next_input))
+        console.print(f"[bold green]Agent 2 ({seed}):[/bold green] {agent2_response.chat_message}")
+        next_input = agent2_response.chat_message
+
+    return next_input
+
+
+async def simulate_conversations(seeds, num_turns=5):
+    return await asyncio.gather(*[simulate_conversation_async(seed=seed, num_turns=num_turns) for seed in seeds])
+
+
 if __name__ == "__main__":
     simulate_conversation(num_turns=5)
+
+    # Run several independent conversations concurrently
+    final_numbers = asyncio.run(simulate_conversations(seeds=[100, 200, 300], num_turns=5))
+    print(f"Final numbers: {final_numbers}")
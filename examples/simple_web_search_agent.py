@@ -29,7 +29,7 @@ def initialize_agent(client, searxng_tool):
 
 def main():
     console = Console()
-    client = instructor.from_openai(openai.OpenAI())
+    client = instructor.from_openai(openai.OpenAI(), mode=instructor.Mode.TOOLS)
     searxng_tool = initialize_searxng_tool()
     agent = initialize_agent(client, searxng_tool)
 
@@ -41,9 +41,14 @@ def main():
             print("Exiting chat...")
             break
 
-        # Fix this
-        response = agent.run(agent.input_schema(tool_input_SearxNGTool=user_input))
-        console.print(f"Agent: {response.chat_message}")
+        # Stream the response, printing only the part of the chat message that is new since the previous update
+        console.print("Agent: ", end="")
+        printed_message = ""
+        for partial_response in agent.run_stream(agent.input_schema(tool_input_SearxNGTool=user_input)):
+            chat_message = partial_response.chat_message or ""
+            console.print(chat_message.removeprefix(printed_message), end="", markup=False, highlight=False)
+            printed_message = chat_message
+        console.print()
 
 
 if __name__ == "__main__":
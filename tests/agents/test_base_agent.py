@@ -1,7 +1,10 @@
+import asyncio
+
 import pytest
-from unittest.mock import Mock, call, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 from pydantic import BaseModel
 import instructor
+from instructor.dsl.partial import Partial
 import inspect
 from atomic_agents.agents.base_agent import (
     BaseIOSchema,
@@ -103,6 +106,110 @@ def test_run(agent):
     agent._post_run.assert_called_once_with(mock_output)
 
 
+def test_get_response_async(agent, mock_instructor, mock_memory, mock_system_prompt_generator):
+    mock_memory.get_history.return_value = [{"role": "user", "content": "Hello"}]
+    mock_system_prompt_generator.generate_prompt.return_value = "System prompt"
+
+    mock_response = Mock(spec=BaseAgentOutputSchema)
+    mock_instructor.chat.completions.create = AsyncMock(return_value=mock_response)
+
+    response = asyncio.run(agent.get_response_async())
+
+    assert response == mock_response
+
+    mock_instructor.chat.completions.create.assert_awaited_once_with(
+        model="gpt-4o-mini",
+        messages=[{"role": "system", "content": "System prompt"}, {"role": "user", "content": "Hello"}],
+        response_model=BaseAgentOutputSchema,
+    )
+
+
+def test_run_async(agent, mock_memory):
+    mock_input = BaseAgentInputSchema(chat_message="Test input")
+    mock_output = BaseAgentOutputSchema(chat_message="Test output")
+
+    agent.get_response_async = AsyncMock(return_value=mock_output)
+
+    result = asyncio.run(agent.run_async(mock_input))
+
+    assert result == mock_output
+    assert agent.current_user_input == mock_input
+
+    mock_memory.add_message.assert_has_calls([call("user", str(mock_input)), call("assistant", str(mock_output))])
+
+
+def test_get_response_stream(agent, mock_instructor, mock_memory, mock_system_prompt_generator):
+    mock_memory.get_history.return_value = [{"role": "user", "content": "Hello"}]
+    mock_system_prompt_generator.generate_prompt.return_value = "System prompt"
+
+    partial_responses = [Mock(), Mock()]
+    mock_instructor.chat.completions.create_partial = Mock(return_value=iter(partial_responses))
+
+    responses = list(agent.get_response_stream())
+
+    assert responses == partial_responses
+    mock_instructor.chat.completions.create_partial.assert_called_once_with(
+        model="gpt-4o-mini",
+        messages=[{"role": "system", "content": "System prompt"}, {"role": "user", "content": "Hello"}],
+        response_model=BaseAgentOutputSchema,
+    )
+
+
+def test_run_stream(agent, mock_memory):
+    mock_input = BaseAgentInputSchema(chat_message="Test input")
+    partial_outputs = [BaseAgentOutputSchema(chat_message="Test"), BaseAgentOutputSchema(chat_message="Test output")]
+
+    agent.get_response_stream = Mock(return_value=iter(partial_outputs))
+
+    result = list(agent.run_stream(mock_input))
+
+    assert result == partial_outputs
+    assert agent.current_user_input == mock_input
+
+    mock_memory.add_message.assert_has_calls([call("user", str(mock_input)), call("assistant", str(partial_outputs[-1]))])
+
+
+def test_run_stream_empty(agent, mock_memory):
+    mock_input = BaseAgentInputSchema(chat_message="Test input")
+
+    agent.get_response_stream = Mock(return_value=iter([]))
+
+    assert list(agent.run_stream(mock_input)) == []
+
+    mock_memory.add_message.assert_called_once_with("user", str(mock_input))
+
+
+def test_run_stream_stopped_early(agent, mock_memory):
+    mock_input = BaseAgentInputSchema(chat_message="Test input")
+    partial_outputs = [BaseAgentOutputSchema(chat_message="Test"), BaseAgentOutputSchema(chat_message="Test output")]
+
+    agent.get_response_stream = Mock(return_value=iter(partial_outputs))
+
+    stream = agent.run_stream(mock_input)
+    assert next(stream) == partial_outputs[0]
+    stream.close()
+
+    mock_memory.add_message.assert_has_calls([call("user", str(mock_input)), call("assistant", str(partial_outputs[0]))])
+    assert mock_memory.add_message.call_count == 2
+
+
+def test_run_stream_error(agent, mock_memory):
+    mock_input = BaseAgentInputSchema(chat_message="Test input")
+
+    def failing_stream(*args, **kwargs):
+        yield BaseAgentOutputSchema(chat_message="Trunc")
+        raise ConnectionError("Connection lost")
+
+    agent.get_response_stream = Mock(side_effect=failing_stream)
+
+    stream = agent.run_stream(mock_input)
+    assert next(stream) == BaseAgentOutputSchema(chat_message="Trunc")
+    with pytest.raises(ConnectionError):
+        next(stream)
+
+    mock_memory.add_message.assert_called_once_with("user", str(mock_input))
+
+
 def test_get_context_provider(agent, mock_system_prompt_generator):
     mock_provider = Mock(spec=SystemPromptContextProviderBase)
     mock_system_prompt_generator.context_providers = {"test_provider": mock_provider}
@@ -185,6 +292,12 @@ def test_base_io_schema_empty_docstring():
             pass
 
 
+def test_base_io_schema_partial_model():
+    partial_schema = Partial[BaseAgentOutputSchema]
+
+    assert partial_schema(chat_message="Test").chat_message == "Test"
+
+
 def test_base_io_schema_model_json_schema_no_description():
     class TestSchema(BaseIOSchema):
         """Test schema docstring."""
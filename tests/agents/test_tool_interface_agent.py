@@ -1,5 +1,7 @@
+import asyncio
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from pydantic import Field
 import instructor
 
@@ -108,3 +110,43 @@ def test_tool_interface_agent_memory_updates(mock_format_tool_message, mock_get_
 
     # Assert that at least 3 messages were added (TOOL CALL, TOOL RESPONSE, and possibly the final response)
     assert len(history) >= 3
+
+
+@patch("atomic_agents.agents.base_agent.BaseAgent.get_response_stream")
+@patch("atomic_agents.agents.base_agent.BaseAgent.get_response")
+def test_tool_interface_agent_get_response_stream(mock_get_response, mock_get_response_stream, tool_interface_agent):
+    mock_tool_input = MockTool.InputSchema(query="Test query")
+    mock_tool_output = MockTool.OutputSchema(result="Mocked result")
+    partial_responses = [Mock(), Mock()]
+
+    mock_get_response.return_value = mock_tool_input
+    mock_get_response_stream.return_value = iter(partial_responses)
+    tool_interface_agent.tool_instance.run = Mock(return_value=mock_tool_output)
+
+    responses = list(tool_interface_agent.get_response_stream())
+
+    tool_interface_agent.tool_instance.run.assert_called_once_with(mock_tool_input)
+    mock_get_response.assert_called_once_with(response_model=MockTool.InputSchema)
+    mock_get_response_stream.assert_called_once_with(response_model=BaseAgentOutputSchema)
+    assert responses == partial_responses
+
+
+@patch("atomic_agents.agents.base_agent.BaseAgent.get_response_async", new_callable=AsyncMock)
+def test_tool_interface_agent_get_response_async(mock_get_response_async, tool_interface_agent):
+    mock_tool_input = MockTool.InputSchema(query="Test query")
+    mock_tool_output = MockTool.OutputSchema(result="Mocked result")
+    mock_final_response = Mock()
+
+    mock_get_response_async.side_effect = [mock_tool_input, mock_final_response]
+    tool_interface_agent.tool_instance.run = Mock(return_value=mock_tool_output)
+
+    response = asyncio.run(tool_interface_agent.get_response_async())
+
+    tool_interface_agent.tool_instance.run.assert_called_once_with(mock_tool_input)
+    assert mock_get_response_async.await_args_list[0].kwargs == {"response_model": MockTool.InputSchema}
+    assert mock_get_response_async.await_args_list[1].kwargs == {"response_model": BaseAgentOutputSchema}
+    assert response == mock_final_response
+
+    history = tool_interface_agent.memory.get_history()
+    assert history[0]["content"].startswith("TOOL CALL: ")
+    assert history[1]["content"] == "TOOL RESPONSE: " + mock_tool_output.model_dump_json()
@@ -132,4 +132,39 @@ def test_generate_prompt_with_empty_context_provider():
 
 # EXTRA INFORMATION AND CONTEXT"""
 
-    assert generator.generate_prompt() == expected_prompt
\ No newline at end of file
+    assert generator.generate_prompt() == expected_prompt
+
+def test_system_prompt_generator_does_not_mutate_input_lists():
+    output_instructions = ["Custom instruction"]
+
+    generator1 = SystemPromptGenerator(output_instructions=output_instructions)
+    generator2 = SystemPromptGenerator(output_instructions=output_instructions)
+
+    assert output_instructions == ["Custom instruction"]
+    assert generator1.generate_prompt() == generator2.generate_prompt()
+
+def test_generators_sharing_lists_render_identical_prompts():
+    background = ["Background info"]
+    steps = ["Step 1"]
+    output_instructions = ["Custom instruction"]
+
+    generator1 = SystemPromptGenerator(background=background, steps=steps, output_instructions=output_instructions)
+    generator2 = SystemPromptGenerator(background=background, steps=steps, output_instructions=output_instructions)
+
+    assert generator1.generate_prompt() == generator2.generate_prompt()
+
+    generator1.background.append("Extra background")
+    generator1.steps.append("Step 2")
+
+    expected_prompt = """# IDENTITY and PURPOSE
+- Background info
+
+# INTERNAL ASSISTANT STEPS
+- Step 1
+
+# OUTPUT INSTRUCTIONS
+- Custom instruction
+- Always respond using the proper JSON schema.
+- Always use the available additional information and context to enhance the response."""
+
+    assert generator2.generate_prompt() == expected_prompt
@@ -1,9 +1,15 @@
+import asyncio
+import subprocess
+import sys
+import threading
+
 import pytest
 from unittest.mock import patch, Mock
 from pydantic import ValidationError
 from youtube_transcript_api import YouTubeTranscriptApi, NoTranscriptFound, TranscriptsDisabled
 from atomic_agents.lib.tools.yt_transcript_scraper_tool import YouTubeTranscriptToolInputSchema
 from atomic_agents.lib.tools.yt_transcript_scraper_tool import (
+    YOUTUBE_VIDEOS_URL,
     YouTubeTranscriptTool,
     YouTubeTranscriptToolConfig,
     YouTubeTranscriptToolInputSchema,
@@ -27,6 +33,22 @@ SAMPLE_VIDEO_INFO = {
     "published_at": "2023-01-01T00:00:00Z",
 }
 
+def make_videos_response(video_ids, status_code=200, etag=None):
+    items = [
+        {
+            "id": video_id,
+            "snippet": {
+                "title": "Sample Video" if video_id == "dQw4w9WgXcQ" else f"Video {video_id}",
+                "channelTitle": "Sample Channel",
+                "publishedAt": "2023-01-01T00:00:00Z",
+            },
+        }
+        for video_id in video_ids
+    ]
+    response = Mock(status_code=status_code, reason="OK")
+    response.json.return_value = {"items": items, **({"etag": etag} if etag else {})}
+    return response
+
 @pytest.fixture
 def youtube_transcript_tool():
     config = YouTubeTranscriptToolConfig(api_key="dummy_api_key")
@@ -53,9 +75,50 @@ def test_extract_video_id():
     video_id = YouTubeTranscriptTool.extract_video_id(url)
     assert video_id == "dQw4w9WgXcQ"
 
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ&t=42",
+        "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ?si=abc",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+        "https://www.youtube.com/embed/dQw4w9WgXcQ",
+        "https://www.youtube.com/live/dQw4w9WgXcQ?feature=share",
+        "youtube.com/watch?v=dQw4w9WgXcQ",
+        "dQw4w9WgXcQ",
+    ],
+)
+def test_extract_video_id_url_variants(url):
+    assert YouTubeTranscriptTool.extract_video_id(url) == "dQw4w9WgXcQ"
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/",
+        "https://www.youtube.com/watch?v=tooshort",
+        "https://youtu.be/",
+        "https://www.youtube.com/channel/UC38IQsAvIsxxjztdMZQtwHA",
+        "not a url",
+    ],
+)
+def test_extract_video_id_invalid(url):
+    with pytest.raises(ValueError, match="Could not extract a YouTube video ID"):
+        YouTubeTranscriptTool.extract_video_id(url)
+
+@patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.YouTubeTranscriptTool.fetch_video_metadata')
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
+def test_run_invalid_url_makes_no_requests(mock_get_transcript, mock_fetch_metadata, youtube_transcript_tool):
+    input_data = YouTubeTranscriptToolInputSchema(video_url="https://www.youtube.com/")
+
+    with pytest.raises(ValueError):
+        youtube_transcript_tool.run(input_data)
+
+    mock_get_transcript.assert_not_called()
+    mock_fetch_metadata.assert_not_called()
+
 @patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.YouTubeTranscriptTool.extract_video_id')
 @patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.YouTubeTranscriptTool.fetch_video_metadata')
-@patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.YouTubeTranscriptApi.get_transcript')
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
 def test_run(mock_get_transcript, mock_fetch_metadata, mock_extract_video_id, youtube_transcript_tool):
     mock_extract_video_id.return_value = "dQw4w9WgXcQ"
     mock_fetch_metadata.return_value = SAMPLE_VIDEO_INFO
@@ -72,7 +135,7 @@ def test_run(mock_get_transcript, mock_fetch_metadata, mock_extract_video_id, yo
 
 @patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.YouTubeTranscriptTool.extract_video_id')
 @patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.YouTubeTranscriptTool.fetch_video_metadata')
-@patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.YouTubeTranscriptApi.get_transcript')
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
 def test_run_with_language(mock_get_transcript, mock_fetch_metadata, mock_extract_video_id, youtube_transcript_tool):
     mock_extract_video_id.return_value = "dQw4w9WgXcQ"
     mock_fetch_metadata.return_value = SAMPLE_VIDEO_INFO
@@ -86,9 +149,64 @@ def test_run_with_language(mock_get_transcript, mock_fetch_metadata, mock_extrac
     
     mock_get_transcript.assert_called_once_with("dQw4w9WgXcQ", languages=["en"])
 
+@patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.YouTubeTranscriptTool.fetch_video_metadata')
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
+def test_run_fetches_transcript_and_metadata_concurrently(mock_get_transcript, mock_fetch_metadata, youtube_transcript_tool):
+    # Both calls wait on the barrier, so this only completes if they run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get_transcript(*args, **kwargs):
+        barrier.wait()
+        return SAMPLE_TRANSCRIPT
+
+    def fetch_metadata(*args, **kwargs):
+        barrier.wait()
+        return SAMPLE_VIDEO_INFO
+
+    mock_get_transcript.side_effect = get_transcript
+    mock_fetch_metadata.side_effect = fetch_metadata
+
+    input_data = YouTubeTranscriptToolInputSchema(video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+    result = youtube_transcript_tool.run(input_data)
+
+    assert result.duration == 8.0
+    assert result.metadata == SAMPLE_VIDEO_INFO
+
+@patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.YouTubeTranscriptTool.fetch_video_metadata')
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
+def test_concurrent_runs_do_not_queue(mock_get_transcript, mock_fetch_metadata, youtube_transcript_tool):
+    num_runs = 6
+    # Every fetch of every run waits on the barrier, so this only completes if none of them are queued
+    barrier = threading.Barrier(2 * num_runs, timeout=5)
+
+    def get_transcript(*args, **kwargs):
+        barrier.wait()
+        return SAMPLE_TRANSCRIPT
+
+    def fetch_metadata(*args, **kwargs):
+        barrier.wait()
+        return SAMPLE_VIDEO_INFO
+
+    mock_get_transcript.side_effect = get_transcript
+    mock_fetch_metadata.side_effect = fetch_metadata
+    results = []
+
+    def run(video_id):
+        input_data = YouTubeTranscriptToolInputSchema(video_url=f"https://www.youtube.com/watch?v={video_id}")
+        results.append(youtube_transcript_tool.run(input_data))
+
+    # Distinct videos, as identical in-flight requests are coalesced
+    threads = [threading.Thread(target=run, args=(f"video{i:06d}",)) for i in range(num_runs)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == num_runs
+
 @patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.YouTubeTranscriptTool.extract_video_id')
 @patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.YouTubeTranscriptTool.fetch_video_metadata')
-@patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.YouTubeTranscriptApi.get_transcript')
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
 def test_run_transcript_not_found(mock_get_transcript, mock_fetch_metadata, mock_extract_video_id, youtube_transcript_tool):
     mock_extract_video_id.return_value = "dQw4w9WgXcQ"
     mock_fetch_metadata.return_value = SAMPLE_VIDEO_INFO
@@ -132,23 +250,9 @@ def test_run_transcripts_disabled(mock_extract_video_id, mock_fetch_metadata, mo
     with pytest.raises(Exception, match="Failed to fetch transcript for video 'dQw4w9WgXcQ': "):
         youtube_transcript_tool.run(input_data)
 
-@patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.build')
-def test_fetch_video_metadata_success(mock_build, youtube_transcript_tool):
-    mock_youtube = Mock()
-    mock_build.return_value = mock_youtube
-    mock_request = Mock()
-    mock_youtube.videos().list.return_value = mock_request
-    mock_request.execute.return_value = {
-        "items": [
-            {
-                "snippet": {
-                    "title": "Sample Video",
-                    "channelTitle": "Sample Channel",
-                    "publishedAt": "2023-01-01T00:00:00Z",
-                }
-            }
-        ]
-    }
+def test_fetch_video_metadata_success(youtube_transcript_tool):
+    youtube_transcript_tool._session = Mock()
+    youtube_transcript_tool._session.get.return_value = make_videos_response(["dQw4w9WgXcQ"])
 
     video_id = "dQw4w9WgXcQ"
     metadata = youtube_transcript_tool.fetch_video_metadata(video_id)
@@ -159,21 +263,299 @@ def test_fetch_video_metadata_success(mock_build, youtube_transcript_tool):
         "channel": "Sample Channel",
         "published_at": "2023-01-01T00:00:00Z",
     }
-    mock_build.assert_called_once_with("youtube", "v3", developerKey=youtube_transcript_tool.api_key)
-    mock_youtube.videos().list.assert_called_once_with(part="snippet", id=video_id)
+    youtube_transcript_tool._session.get.assert_called_once_with(
+        YOUTUBE_VIDEOS_URL,
+        params={"part": "snippet", "id": video_id, "key": youtube_transcript_tool.api_key},
+        headers={},
+        timeout=youtube_transcript_tool.http_timeout,
+    )
 
-@patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.build')
-def test_fetch_video_metadata_no_items(mock_build, youtube_transcript_tool):
-    mock_youtube = Mock()
-    mock_build.return_value = mock_youtube
-    mock_request = Mock()
-    mock_youtube.videos().list.return_value = mock_request
-    mock_request.execute.return_value = {"items": []}
+def test_fetch_video_metadata_no_items(youtube_transcript_tool):
+    youtube_transcript_tool._session = Mock()
+    youtube_transcript_tool._session.get.return_value = make_videos_response([])
 
     video_id = "dQw4w9WgXcQ"
 
     with pytest.raises(Exception, match=f"No metadata found for video '{video_id}'"):
         youtube_transcript_tool.fetch_video_metadata(video_id)
 
-    mock_build.assert_called_once_with("youtube", "v3", developerKey=youtube_transcript_tool.api_key)
-    mock_youtube.videos().list.assert_called_once_with(part="snippet", id=video_id)
+    youtube_transcript_tool._session.get.assert_called_once()
+
+def test_fetch_video_metadata_request_failed(youtube_transcript_tool):
+    youtube_transcript_tool._session = Mock()
+    youtube_transcript_tool._session.get.return_value = Mock(status_code=403, reason="Forbidden")
+
+    with pytest.raises(Exception, match="Failed to fetch metadata for videos 'dQw4w9WgXcQ': 403 Forbidden"):
+        youtube_transcript_tool.fetch_video_metadata("dQw4w9WgXcQ")
+
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
+def test_run_many(mock_get_transcript, youtube_transcript_tool):
+    mock_get_transcript.return_value = SAMPLE_TRANSCRIPT
+    youtube_transcript_tool._session = Mock()
+    youtube_transcript_tool._session.get.return_value = make_videos_response(["dQw4w9WgXcQ", "t1e8gqXLbsU"])
+
+    params_list = [
+        YouTubeTranscriptToolInputSchema(video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ"),
+        YouTubeTranscriptToolInputSchema(video_url="https://www.youtube.com/watch?v=t1e8gqXLbsU", language="en"),
+    ]
+    results = asyncio.run(youtube_transcript_tool.run_many(params_list))
+
+    assert [result.metadata["title"] for result in results] == ["Sample Video", "Video t1e8gqXLbsU"]
+    assert all(result.duration == 8.0 for result in results)
+    youtube_transcript_tool._session.get.assert_called_once()
+    assert youtube_transcript_tool._session.get.call_args.kwargs["params"]["id"] == "dQw4w9WgXcQ,t1e8gqXLbsU"
+    mock_get_transcript.assert_any_call("t1e8gqXLbsU", languages=["en"])
+
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
+def test_run_many_missing_metadata(mock_get_transcript, youtube_transcript_tool):
+    mock_get_transcript.return_value = SAMPLE_TRANSCRIPT
+    youtube_transcript_tool._session = Mock()
+    youtube_transcript_tool._session.get.return_value = make_videos_response([])
+
+    params_list = [YouTubeTranscriptToolInputSchema(video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ")]
+
+    with pytest.raises(Exception, match="No metadata found for video 'dQw4w9WgXcQ'"):
+        asyncio.run(youtube_transcript_tool.run_many(params_list))
+
+def test_fetch_video_metadata_cached(youtube_transcript_tool):
+    youtube_transcript_tool._session = Mock()
+    youtube_transcript_tool._session.get.return_value = make_videos_response(["dQw4w9WgXcQ"])
+
+    video_id = "dQw4w9WgXcQ"
+    first = youtube_transcript_tool.fetch_video_metadata(video_id)
+    second = youtube_transcript_tool.fetch_video_metadata(video_id)
+
+    assert first == second == SAMPLE_VIDEO_INFO
+    youtube_transcript_tool._session.get.assert_called_once()
+
+    youtube_transcript_tool.fetch_video_metadata(video_id, use_cache=False)
+    assert youtube_transcript_tool._session.get.call_count == 2
+
+@patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.YouTubeTranscriptTool.fetch_video_metadata')
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
+def test_run_no_cache(mock_get_transcript, mock_fetch_metadata, youtube_transcript_tool):
+    mock_get_transcript.return_value = SAMPLE_TRANSCRIPT
+    mock_fetch_metadata.return_value = SAMPLE_VIDEO_INFO
+
+    input_data = YouTubeTranscriptToolInputSchema(video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ", no_cache=True)
+    youtube_transcript_tool.run(input_data)
+
+    mock_fetch_metadata.assert_called_once_with("dQw4w9WgXcQ", False)
+
+def test_metadata_cache_config():
+    config = YouTubeTranscriptToolConfig(api_key="dummy_api_key", metadata_cache_ttl=60, metadata_cache_maxsize=10)
+    tool = YouTubeTranscriptTool(config)
+
+    assert tool._metadata_cache.ttl == 60
+    assert tool._metadata_cache.maxsize == 10
+
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
+def test_fetch_transcript_fresh_cache_hit(mock_get_transcript, youtube_transcript_tool):
+    mock_get_transcript.return_value = SAMPLE_TRANSCRIPT
+
+    first = youtube_transcript_tool.fetch_transcript("dQw4w9WgXcQ", "en")
+    second = youtube_transcript_tool.fetch_transcript("dQw4w9WgXcQ", "en")
+
+    assert first == second == SAMPLE_TRANSCRIPT
+    mock_get_transcript.assert_called_once_with("dQw4w9WgXcQ", languages=["en"])
+
+@patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.time.time')
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
+def test_fetch_transcript_stale_cache_hit_refreshes(mock_get_transcript, mock_time, youtube_transcript_tool):
+    updated_transcript = [{"text": "Updated transcript.", "start": 0.0, "duration": 4.0}]
+    mock_get_transcript.side_effect = [SAMPLE_TRANSCRIPT, updated_transcript]
+    mock_time.return_value = 0.0
+    youtube_transcript_tool.fetch_transcript("dQw4w9WgXcQ")
+
+    # Older than the TTL, but within the stale window
+    mock_time.return_value = youtube_transcript_tool.transcript_cache_ttl + 1
+    stale = youtube_transcript_tool.fetch_transcript("dQw4w9WgXcQ")
+    youtube_transcript_tool._refresh_executor.shutdown(wait=True)
+
+    assert stale == SAMPLE_TRANSCRIPT
+    assert mock_get_transcript.call_count == 2
+    assert youtube_transcript_tool.fetch_transcript("dQw4w9WgXcQ") == updated_transcript
+
+
+@patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.time.time')
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
+def test_fetch_transcript_stale_hits_refresh_once(mock_get_transcript, mock_time, youtube_transcript_tool):
+    release = threading.Event()
+
+    def get_transcript(*args, **kwargs):
+        release.wait(timeout=5)
+        return SAMPLE_TRANSCRIPT
+
+    mock_time.return_value = 0.0
+    youtube_transcript_tool._store_transcript("dQw4w9WgXcQ", None, SAMPLE_TRANSCRIPT)
+    mock_get_transcript.side_effect = get_transcript
+
+    mock_time.return_value = youtube_transcript_tool.transcript_cache_ttl + 1
+    for _ in range(20):
+        assert youtube_transcript_tool.fetch_transcript("dQw4w9WgXcQ") == SAMPLE_TRANSCRIPT
+    release.set()
+    youtube_transcript_tool._refresh_executor.shutdown(wait=True)
+
+    mock_get_transcript.assert_called_once()
+    assert youtube_transcript_tool._pending_refreshes == set()
+
+@patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.time.time')
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
+def test_fetch_transcript_expired_cache_entry(mock_get_transcript, mock_time, youtube_transcript_tool):
+    mock_get_transcript.return_value = SAMPLE_TRANSCRIPT
+    mock_time.return_value = 0.0
+    youtube_transcript_tool.fetch_transcript("dQw4w9WgXcQ")
+
+    mock_time.return_value = youtube_transcript_tool.transcript_cache_stale_ttl + 1
+    youtube_transcript_tool.fetch_transcript("dQw4w9WgXcQ")
+
+    assert mock_get_transcript.call_count == 2
+
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
+def test_fetch_transcript_no_cache(mock_get_transcript, youtube_transcript_tool):
+    mock_get_transcript.return_value = SAMPLE_TRANSCRIPT
+
+    youtube_transcript_tool.fetch_transcript("dQw4w9WgXcQ", use_cache=False)
+    youtube_transcript_tool.fetch_transcript("dQw4w9WgXcQ", use_cache=False)
+
+    assert mock_get_transcript.call_count == 2
+    assert youtube_transcript_tool._get_cached_transcript("dQw4w9WgXcQ") is None
+
+def test_transcript_cache_persists_to_disk(tmp_path):
+    config = YouTubeTranscriptToolConfig(api_key="dummy_api_key", transcript_cache_path=str(tmp_path / "transcripts.db"))
+    YouTubeTranscriptTool(config)._store_transcript("dQw4w9WgXcQ", "en", SAMPLE_TRANSCRIPT)
+
+    transcripts, _ = YouTubeTranscriptTool(config)._get_cached_transcript("dQw4w9WgXcQ", "en")
+
+    assert transcripts == SAMPLE_TRANSCRIPT
+
+def test_fetch_video_metadata_bulk_chunks_requests(youtube_transcript_tool):
+    youtube_transcript_tool._session = Mock()
+    youtube_transcript_tool._session.get.side_effect = lambda url, params, **kwargs: make_videos_response(
+        params["id"].split(",")
+    )
+
+    video_ids = [f"video{i:06d}" for i in range(120)]
+    metadata = youtube_transcript_tool.fetch_video_metadata_bulk(video_ids)
+
+    assert list(metadata) == video_ids
+    assert metadata["video000042"]["title"] == "Video video000042"
+    chunk_sizes = [len(call.kwargs["params"]["id"].split(",")) for call in youtube_transcript_tool._session.get.call_args_list]
+    assert chunk_sizes == [50, 50, 20]
+
+def test_http_connection_pool_config():
+    config = YouTubeTranscriptToolConfig(api_key="dummy_api_key", http_pool_connections=2, http_pool_maxsize=4)
+    tool = YouTubeTranscriptTool(config)
+
+    adapter = tool._session.get_adapter(YOUTUBE_VIDEOS_URL)
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 4
+
+def test_fetch_video_metadata_revalidates_with_etag(youtube_transcript_tool):
+    youtube_transcript_tool._session = Mock()
+    youtube_transcript_tool._session.get.side_effect = [
+        make_videos_response(["dQw4w9WgXcQ"], etag="etag-1"),
+        Mock(status_code=304, reason="Not Modified"),
+    ]
+
+    assert youtube_transcript_tool.fetch_video_metadata("dQw4w9WgXcQ") == SAMPLE_VIDEO_INFO
+
+    # Once the cached metadata expires, it is revalidated instead of downloaded again
+    youtube_transcript_tool._metadata_cache.clear()
+    assert youtube_transcript_tool.fetch_video_metadata("dQw4w9WgXcQ") == SAMPLE_VIDEO_INFO
+
+    conditional_headers = youtube_transcript_tool._session.get.call_args_list[1].kwargs["headers"]
+    assert conditional_headers == {"If-None-Match": "etag-1"}
+    assert "dQw4w9WgXcQ" in youtube_transcript_tool._metadata_cache
+
+def test_fetch_video_metadata_no_cache_skips_etag(youtube_transcript_tool):
+    youtube_transcript_tool._session = Mock()
+    youtube_transcript_tool._session.get.return_value = make_videos_response([], etag="etag-1")
+
+    youtube_transcript_tool.fetch_video_metadata_bulk(["dQw4w9WgXcQ"], use_cache=False)
+
+    assert len(youtube_transcript_tool._metadata_etags) == 0
+
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
+def test_fetch_transcript_coalesces_concurrent_requests(mock_get_transcript, youtube_transcript_tool):
+    started = threading.Event()
+    release = threading.Event()
+
+    def get_transcript(*args, **kwargs):
+        started.set()
+        release.wait(timeout=5)
+        return SAMPLE_TRANSCRIPT
+
+    mock_get_transcript.side_effect = get_transcript
+    results = []
+
+    def fetch():
+        results.append(youtube_transcript_tool.fetch_transcript("dQw4w9WgXcQ", use_cache=False))
+
+    first = threading.Thread(target=fetch)
+    first.start()
+    started.wait(timeout=5)
+    second = threading.Thread(target=fetch)
+    second.start()
+    # Give the second caller time to join the in-flight request before it completes
+    second.join(timeout=0.2)
+    release.set()
+    first.join()
+    second.join()
+
+    assert results == [SAMPLE_TRANSCRIPT, SAMPLE_TRANSCRIPT]
+    mock_get_transcript.assert_called_once()
+    assert youtube_transcript_tool._inflight == {}
+
+def test_singleflight_propagates_exceptions(youtube_transcript_tool):
+    def fail():
+        raise RuntimeError("Request failed")
+
+    with pytest.raises(RuntimeError, match="Request failed"):
+        youtube_transcript_tool._singleflight(("metadata", "dQw4w9WgXcQ"), fail)
+
+    assert youtube_transcript_tool._inflight == {}
+
+def test_module_import_does_not_load_youtube_transcript_api():
+    code = (
+        "import sys; import atomic_agents.lib.tools.yt_transcript_scraper_tool; "
+        "sys.exit('youtube_transcript_api' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+@patch('atomic_agents.lib.tools.yt_transcript_scraper_tool.time.time')
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
+def test_fetch_transcript_failed_refresh_is_logged(mock_get_transcript, mock_time, youtube_transcript_tool, caplog):
+    mock_get_transcript.side_effect = [SAMPLE_TRANSCRIPT, RuntimeError("Network error")]
+    mock_time.return_value = 0.0
+    youtube_transcript_tool.fetch_transcript("dQw4w9WgXcQ")
+
+    mock_time.return_value = youtube_transcript_tool.transcript_cache_ttl + 1
+    with caplog.at_level("WARNING", logger="atomic_agents.lib.tools.yt_transcript_scraper_tool"):
+        assert youtube_transcript_tool.fetch_transcript("dQw4w9WgXcQ") == SAMPLE_TRANSCRIPT
+        youtube_transcript_tool._refresh_executor.shutdown(wait=True)
+
+    assert "Failed to refresh cached transcript: Network error" in caplog.text
+
+
+@patch('youtube_transcript_api.YouTubeTranscriptApi.get_transcript')
+def test_run_many_no_cache_only_affects_its_input(mock_get_transcript, youtube_transcript_tool):
+    mock_get_transcript.return_value = SAMPLE_TRANSCRIPT
+    youtube_transcript_tool._session = Mock()
+    youtube_transcript_tool._session.get.side_effect = lambda url, params, **kwargs: make_videos_response(
+        params["id"].split(",")
+    )
+    # Cached metadata for the video that does not bypass the cache
+    youtube_transcript_tool._metadata_cache["dQw4w9WgXcQ"] = SAMPLE_VIDEO_INFO
+
+    params_list = [
+        YouTubeTranscriptToolInputSchema(video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ"),
+        YouTubeTranscriptToolInputSchema(video_url="https://www.youtube.com/watch?v=t1e8gqXLbsU", no_cache=True),
+    ]
+    results = asyncio.run(youtube_transcript_tool.run_many(params_list))
+
+    assert [result.metadata["title"] for result in results] == ["Sample Video", "Video t1e8gqXLbsU"]
+    # Only the no_cache video is requested, and its metadata is not cached
+    youtube_transcript_tool._session.get.assert_called_once()
+    assert youtube_transcript_tool._session.get.call_args.kwargs["params"]["id"] == "t1e8gqXLbsU"
+    assert "t1e8gqXLbsU" not in youtube_transcript_tool._metadata_cache